@@ -0,0 +1,111 @@
+"""
+Fichier : backend/app/api/cache.py
+
+Ce module fournit un cache mémoire des réponses des endpoints de liste.
+
+Les tables exposées (sites, trb, pmwo, swo) sont en lecture seule côté
+API et changent peu : une même page demandée plusieurs fois dans un
+court intervalle est servie depuis la mémoire, sans requête PostgreSQL
+ni sérialisation JSON.
+
+Le cache est propre à chaque worker (processus) et borné en octets.
+Il est désactivé si RESPONSE_CACHE_TTL vaut 0.
+"""
+
+from typing import AsyncIterable, AsyncIterator, Hashable, List, Optional
+
+from cachetools import TTLCache
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncResult
+
+from app.api.responses import stream_json_rows
+from app.core.config import settings
+
+
+class ResponseCache:
+    """
+    Cache TTL des corps JSON renvoyés par les endpoints de liste.
+
+    Attributs
+    ---------
+    enabled : bool
+        Faux si la durée de vie ou la taille maximale vaut 0.
+    max_bytes : int
+        Taille totale maximale des corps mis en cache (octets).
+    """
+
+    def __init__(self, ttl: int, max_bytes: int) -> None:
+        self.enabled = ttl > 0 and max_bytes > 0
+        self.max_bytes = max_bytes
+        # getsizeof=len : la taille du cache est comptée en octets.
+        self._entries: TTLCache = TTLCache(maxsize=max(max_bytes, 1), ttl=max(ttl, 1), getsizeof=len)
+
+    def get(self, key: Hashable) -> Optional[Response]:
+        """
+        Retourne la réponse en cache pour la clé, ou None.
+
+        Paramètres
+        ----------
+        key : Hashable
+            Clé identifiant la requête (table, colonnes, pagination).
+
+        Returns
+        -------
+        Optional[Response]
+            Réponse JSON prête à l'envoi (en-tête X-Cache: HIT).
+        """
+        if not self.enabled:
+            return None
+        body = self._entries.get(key)
+        if body is None:
+            return None
+        return Response(body, media_type="application/json", headers={"X-Cache": "HIT"})
+
+    def stream(self, key: Hashable, result: AsyncResult) -> StreamingResponse:
+        """
+        Diffuse un résultat SQL et mémorise le corps une fois envoyé.
+
+        Paramètres
+        ----------
+        key : Hashable
+            Clé sous laquelle stocker le corps complet.
+        result : AsyncResult
+            Résultat obtenu via AsyncSession.stream().
+
+        Returns
+        -------
+        StreamingResponse
+            Réponse diffusée (en-tête X-Cache: MISS).
+        """
+        response = stream_json_rows(result)
+        if self.enabled:
+            response.body_iterator = self._collect(key, response.body_iterator)
+        response.headers["X-Cache"] = "MISS"
+        return response
+
+    async def _collect(self, key: Hashable, chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        """
+        Relaie les morceaux au client tout en les accumulant.
+
+        L'accumulation est abandonnée dès que le corps dépasse max_bytes ;
+        rien n'est stocké si le flux est interrompu avant la fin.
+        """
+        collected: Optional[List[bytes]] = []
+        size = 0
+        async for chunk in chunks:
+            if collected is not None:
+                size += len(chunk)
+                if size > self.max_bytes:
+                    collected = None
+                else:
+                    collected.append(chunk)
+            yield chunk
+        if collected is not None:
+            self._entries[key] = b"".join(collected)
+
+
+# Instance partagée par les routes v1.
+response_cache = ResponseCache(
+    ttl=settings.RESPONSE_CACHE_TTL,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+)
@@ -3,10 +3,120 @@ Fichier : backend/app/api/deps.py
 
 Ce module regroupe les dépendances partagées des routes FastAPI.
 
-Pour l'instant, il ré-exporte simplement get_db, mais il est déjà prêt
-à accueillir d'autres dépendances (authentification, permissions, etc.).
+Il ré-exporte get_db et fournit :
+- table_columns, qui traduit le paramètre de requête `fields` en liste
+  de colonnes à sélectionner ;
+- list_rows, le corps commun des endpoints de liste (JSON diffusé et mis
+  en cache, ou export CSV).
+
+Il reste prêt à accueillir d'autres dépendances (authentification,
+permissions, etc.).
 """
 
+from typing import Awaitable, Callable, List, Optional
+
+from fastapi import HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import Column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.cache import response_cache
+from app.db.export import stream_copy_csv
 from app.db.session import get_db
+from app.db.tables import get_table
+
+__all__ = ["get_db", "list_rows", "table_columns"]
+
+
+def table_columns(table_name: str) -> Callable[..., Awaitable[List[Column]]]:
+    """
+    Fabrique une dépendance FastAPI résolvant les colonnes demandées.
+
+    Sans paramètre `fields`, toutes les colonnes de la table sont
+    retournées. Avec `fields=col1,col2`, seules ces colonnes sont
+    sélectionnées, ce qui réduit le volume transféré depuis PostgreSQL
+    et la taille de la réponse JSON.
+
+    Paramètres
+    ----------
+    table_name : str
+        Nom de la table dans la base PostgreSQL (par ex. "sites").
+
+    Returns
+    -------
+    Callable[..., Awaitable[List[Column]]]
+        Dépendance à utiliser avec `Depends` dans les endpoints.
+    """
+
+    # Dépendance async : sans I/O, elle s'exécute directement dans la
+    # boucle d'événements au lieu d'être déléguée au threadpool.
+    async def dependency(
+        fields: Optional[str] = Query(
+            None,
+            description="Colonnes à retourner, séparées par des virgules (toutes par défaut)",
+        ),
+    ) -> List[Column]:
+        table = get_table(table_name)
+        names = [name.strip() for name in (fields or "").split(",") if name.strip()]
+        if not names:
+            return list(table.c)
+
+        unknown = [name for name in names if name not in table.c]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Colonnes inconnues pour la table '{table_name}' : {', '.join(unknown)}",
+            )
+        # dict.fromkeys dédoublonne en conservant l'ordre demandé.
+        return [table.c[name] for name in dict.fromkeys(names)]
+
+    return dependency
+
+
+async def list_rows(
+    db: AsyncSession,
+    table_name: str,
+    columns: List[Column],
+    limit: int,
+    offset: int,
+    output_format: str = "json",
+) -> Response:
+    """
+    Construit la réponse d'un endpoint de liste.
+
+    En JSON, une page déjà servie récemment est renvoyée depuis le cache
+    mémoire ; sinon les lignes sont diffusées par lots et mises en cache.
+    En CSV, l'export COPY de PostgreSQL est diffusé tel quel.
+
+    Paramètres
+    ----------
+    db : AsyncSession
+        Session asynchrone de la requête courante.
+    table_name : str
+        Nom de la table, utilisé dans la clé de cache.
+    columns : List[Column]
+        Colonnes à sélectionner (voir table_columns).
+    limit : int
+        Nombre de lignes maximum à retourner.
+    offset : int
+        Décalage (nombre de lignes à ignorer) pour la pagination.
+    output_format : str
+        "json" (par défaut) ou "csv".
+
+    Returns
+    -------
+    Response
+        Réponse JSON (diffusée ou en cache) ou CSV.
+    """
+    stmt = select(*columns).offset(offset).limit(limit)
+    if output_format == "csv":
+        return StreamingResponse(stream_copy_csv(db, stmt), media_type="text/csv")
+
+    key = (table_name, tuple(column.name for column in columns), limit, offset)
+    cached = response_cache.get(key)
+    if cached is not None:
+        return cached
 
-__all__ = ["get_db"]
+    # yield_per active un curseur côté serveur : les lignes arrivent par
+    # lots de 1000 et chaque lot est envoyé au client dès sa réception.
+    return response_cache.stream(key, await db.stream(stmt.execution_options(yield_per=1000)))
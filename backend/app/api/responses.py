@@ -0,0 +1,127 @@
+"""
+Fichier : backend/app/api/responses.py
+
+Ce module regroupe les classes et fonctions de réponse HTTP partagées
+par les routes.
+
+- ORJSONResponse sérialise le contenu avec orjson (implémenté en Rust),
+  nettement plus rapide que le module json standard ;
+- stream_json_rows envoie un résultat SQL sous forme de tableau JSON,
+  lot par lot, sans matérialiser toutes les lignes en mémoire ;
+- JSON_ROWS_RESPONSES documente ce format dans le schéma OpenAPI.
+"""
+
+from typing import Any, AsyncIterator, Dict
+
+import orjson
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic_core import to_jsonable_python
+from sqlalchemy.ext.asyncio import AsyncResult
+
+# Description OpenAPI des endpoints renvoyant une liste de lignes.
+# Elle remplace response_model=List[Dict[str, Any]] : le schéma reste
+# documenté sans que FastAPI ne valide chaque ligne via Pydantic.
+# Avec ?format=csv, le corps est l'export COPY (en-tête + lignes).
+JSON_ROWS_RESPONSES: Dict[int, Dict[str, Any]] = {
+    200: {
+        "description": "Liste de lignes {nom_colonne: valeur}, ou CSV avec format=csv.",
+        "content": {
+            "application/json": {
+                "schema": {"type": "array", "items": {"type": "object"}},
+            },
+            "text/csv": {
+                "schema": {"type": "string"},
+            },
+        },
+    },
+}
+
+
+# OPT_UTC_Z : les datetimes UTC sont suffixés par "Z", comme pydantic.
+# OPT_NON_STR_KEYS : les noms de colonnes réfléchis sont des quoted_name
+# (sous-classe de str), refusés sinon comme clés.
+_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _dumps(content: Any) -> bytes:
+    """
+    Encode le contenu en JSON (bytes) via orjson.
+
+    Les types natifs (str, int, float, datetime, UUID...) sont encodés
+    directement par orjson. Les autres (Decimal, timedelta, bytes...)
+    sont délégués à pydantic afin de conserver exactement le format
+    produit jusqu'ici par FastAPI (ex. Decimal -> "12.50").
+    """
+    try:
+        return orjson.dumps(content, default=to_jsonable_python, option=_OPTIONS)
+    except orjson.JSONEncodeError:
+        # orjson refuse les datetime.time avec fuseau (colonnes "time with
+        # time zone") sans passer par `default`. On réencode alors en
+        # déléguant toutes les dates à pydantic : "10:00:00+02:00".
+        return orjson.dumps(
+            content,
+            default=to_jsonable_python,
+            option=_OPTIONS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    Réponse JSON sérialisée via orjson.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """
+        Encode le contenu en JSON (bytes).
+
+        Paramètres
+        ----------
+        content : Any
+            Données à sérialiser (typiquement une liste de dictionnaires).
+
+        Returns
+        -------
+        bytes
+            Corps JSON encodé en UTF-8.
+        """
+        return _dumps(content)
+
+
+async def _iter_json_rows(result: AsyncResult) -> AsyncIterator[bytes]:
+    """
+    Produit un tableau JSON morceau par morceau à partir d'un résultat SQL.
+
+    Chaque partition (taille fixée par yield_per) est encodée d'un bloc
+    par orjson ; on retire ses crochets pour la concaténer aux autres.
+    """
+    columns = tuple(result.keys())
+    separator = b"["
+    async for partition in result.partitions():
+        chunk = _dumps([dict(zip(columns, row)) for row in partition])
+        yield separator + chunk[1:-1]
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+
+def stream_json_rows(result: AsyncResult) -> StreamingResponse:
+    """
+    Construit une réponse HTTP diffusant les lignes d'un résultat SQL.
+
+    Les octets partent vers le client dès le premier lot reçu de la base :
+    la mémoire consommée reste bornée à un lot, quel que soit `limit`.
+
+    Paramètres
+    ----------
+    result : AsyncResult
+        Résultat obtenu via AsyncSession.stream(), idéalement avec
+        l'option yield_per pour fixer la taille des lots.
+
+    Returns
+    -------
+    StreamingResponse
+        Réponse "application/json" contenant une liste de dictionnaires
+        {nom_colonne: valeur}.
+    """
+    return StreamingResponse(_iter_json_rows(result), media_type="application/json")
@@ -0,0 +1,19 @@
+"""
+Fichier : backend/app/api/v1/api.py
+
+Router principal de l'API v1.
+
+Il regroupe les routers de chaque ressource (sites, trb, pmwo, swo)
+sous le préfixe commun /api/v1, afin que main.py n'ait qu'un seul
+router à enregistrer.
+"""
+
+from fastapi import APIRouter
+
+from app.api.v1 import routes_pmwo, routes_sites, routes_swo, routes_trb
+
+api_router = APIRouter(prefix="/api/v1")
+api_router.include_router(routes_sites.router)
+api_router.include_router(routes_trb.router)
+api_router.include_router(routes_pmwo.router)
+api_router.include_router(routes_swo.router)
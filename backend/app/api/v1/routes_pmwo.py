@@ -4,28 +4,28 @@ Fichier : backend/app/api/v1/routes_pmwo.py
 Endpoints pour la table "pmwo".
 """
 
-from typing import Any, Dict, List
+from typing import List, Literal
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from fastapi.responses import Response
+from sqlalchemy import Column
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
-from app.db.tables import get_table
+from app.api.deps import get_db, list_rows, table_columns
+from app.api.responses import JSON_ROWS_RESPONSES
 
 router = APIRouter(prefix="/pmwo", tags=["pmwo"])
 
 
-@router.get("/", response_model=List[Dict[str, Any]])
-def list_pmwo(
-    db: Session = Depends(get_db),
+@router.get("/", responses=JSON_ROWS_RESPONSES)
+async def list_pmwo(
+    db: AsyncSession = Depends(get_db),
+    columns: List[Column] = Depends(table_columns("pmwo")),
     limit: int = Query(10000, ge=1, le=10000),
     offset: int = Query(0, ge=0),
-) -> List[Dict[str, Any]]:
+    output_format: Literal["json", "csv"] = Query("json", alias="format", description="Format de sortie"),
+) -> Response:
     """
     Liste les lignes de la table "pmwo" avec pagination simple.
     """
-    table = get_table("pmwo")
-    stmt = select(table).offset(offset).limit(limit)
-    rows = db.execute(stmt).all()
-    return [dict(row._mapping) for row in rows]
+    return await list_rows(db, "pmwo", columns, limit, offset, output_format)
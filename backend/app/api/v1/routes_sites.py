@@ -12,44 +12,49 @@ GET /api/v1/sites
     sous forme de dictionnaires {colonne: valeur}.
 """
 
-from typing import Any, Dict, List
+from typing import List, Literal
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from fastapi.responses import Response
+from sqlalchemy import Column
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
-from app.db.tables import get_table
+from app.api.deps import get_db, list_rows, table_columns
+from app.api.responses import JSON_ROWS_RESPONSES
 
 router = APIRouter(prefix="/sites", tags=["sites"])
 
 
-@router.get("/", response_model=List[Dict[str, Any]])
-def list_sites(
-    db: Session = Depends(get_db),
+@router.get("/", responses=JSON_ROWS_RESPONSES)
+async def list_sites(
+    db: AsyncSession = Depends(get_db),
+    columns: List[Column] = Depends(table_columns("sites")),
     limit: int = Query(1000, ge=1, le=1000, description="Nombre maximum de lignes à retourner"),
     offset: int = Query(0, ge=0, description="Décalage pour la pagination"),
-) -> List[Dict[str, Any]]:
+    output_format: Literal["json", "csv"] = Query("json", alias="format", description="Format de sortie"),
+) -> Response:
     """
     Liste les lignes de la table "sites" avec pagination simple.
 
     Paramètres
     ----------
-    db : Session
-        Session SQLAlchemy injectée par FastAPI.
+    db : AsyncSession
+        Session SQLAlchemy asynchrone injectée par FastAPI.
+    columns : List[Column]
+        Colonnes à sélectionner (paramètre `fields`, toutes par défaut).
     limit : int
         Nombre de lignes maximum à retourner.
     offset : int
         Décalage (nombre de lignes à ignorer) pour la pagination.
+    output_format : str
+        "json" (par défaut) ou "csv" : export brut produit par
+        PostgreSQL via COPY, sans conversion ligne à ligne en Python.
 
     Returns
     -------
-    List[Dict[str, Any]]
+    Response
         Liste de lignes, chacune représentée par un dictionnaire
-        {nom_colonne: valeur}.
+        {nom_colonne: valeur}, diffusée en JSON par lots ou servie
+        depuis le cache.
     """
-    table = get_table("sites")
-    stmt = select(table).offset(offset).limit(limit)
-    rows = db.execute(stmt).all()
-    # row._mapping permet d'accéder à un mapping nom_colonne -> valeur.
-    return [dict(row._mapping) for row in rows]
+    return await list_rows(db, "sites", columns, limit, offset, output_format)
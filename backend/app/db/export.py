@@ -0,0 +1,81 @@
+"""
+Fichier : backend/app/db/export.py
+
+Ce module fournit l'export brut de résultats SQL via le protocole COPY
+de PostgreSQL.
+
+Avec COPY ... TO STDOUT, c'est PostgreSQL qui formate les lignes (CSV) :
+aucune ligne n'est convertie en objet Python côté application, ce qui
+rend l'export de grandes tables bien moins coûteux qu'un SELECT classique.
+"""
+
+import asyncio
+import contextlib
+from typing import AsyncIterator, Optional, Union
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import engine
+
+# Nombre maximal de blocs COPY en attente d'envoi au client : au-delà,
+# la lecture depuis PostgreSQL est suspendue (mémoire bornée).
+_QUEUE_SIZE = 16
+
+
+async def stream_copy_csv(db: AsyncSession, stmt: Select) -> AsyncIterator[bytes]:
+    """
+    Exécute une requête SELECT via COPY et produit le CSV bloc par bloc.
+
+    Les blocs reçus de PostgreSQL passent par une file bornée : ils sont
+    transmis au client au fil de l'eau, sans accumuler l'export en mémoire.
+
+    Paramètres
+    ----------
+    db : AsyncSession
+        Session asynchrone de la requête courante. Elle doit rester
+        ouverte jusqu'à la fin de l'itération.
+    stmt : Select
+        Requête à exporter. Ses paramètres (limit, offset...) sont
+        intégrés littéralement au SQL : ils doivent déjà être validés.
+
+    Yields
+    ------
+    bytes
+        Morceaux du contenu CSV (UTF-8), ligne d'en-tête comprise.
+    """
+    # COPY n'accepte pas de paramètres liés : la requête est compilée
+    # avec ses valeurs littérales (entiers validés par FastAPI).
+    sql = str(stmt.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    queue: "asyncio.Queue[Union[bytes, BaseException, None]]" = asyncio.Queue(maxsize=_QUEUE_SIZE)
+
+    async def write(data: bytearray) -> None:
+        # asyncpg fournit un tampon mutable : il est copié avant mise en file.
+        await queue.put(bytes(data))
+
+    async def produce() -> None:
+        # None signale la fin du flux ; une erreur est relayée telle quelle.
+        try:
+            await raw.driver_connection.copy_from_query(sql, output=write, format="csv", header=True)
+        except Exception as exc:
+            await queue.put(exc)
+        else:
+            await queue.put(None)
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            chunk: Optional[Union[bytes, BaseException]] = await queue.get()
+            if chunk is None:
+                break
+            if isinstance(chunk, BaseException):
+                raise chunk
+            yield chunk
+    finally:
+        # Client déconnecté ou erreur : la copie est interrompue avant que
+        # la session (et sa connexion) ne soit rendue au pool.
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
@@ -2,34 +2,117 @@
 Fichier : backend/app/db/session.py
 
 Ce module gère :
-- la création de l'engine SQLAlchemy connecté à PostgreSQL ;
-- la fabrique de sessions (SessionLocal) utilisée dans les endpoints FastAPI.
+- la création de l'engine SQLAlchemy asynchrone (driver asyncpg)
+  connecté à PostgreSQL ;
+- la fabrique de sessions (AsyncSessionLocal) utilisée dans les endpoints FastAPI.
 
 Il représente la couche d'accès à la base de données, centralisée
 et réutilisable dans d'autres projets.
+
+Toutes les requêtes (réflexion comprise) passent par asyncpg : l'attente
+réseau se fait dans la boucle d'événements, sans occuper de thread.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+import asyncio
+from typing import Any, AsyncIterator, Dict, Tuple
+from uuid import uuid4
+
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
-# Engine SQLAlchemy :
-# pool_pre_ping permet de vérifier que les connexions sont encore valides.
+
+def _asyncpg_url(raw_url: str) -> Tuple[URL, Dict[str, Any]]:
+    """
+    Adapte une URL PostgreSQL au format libpq pour le driver asyncpg.
+
+    SQLAlchemy transmet les paramètres de l'URL (?sslmode=...) tels quels
+    à asyncpg.connect(), qui ne connaît pas les noms libpq. Les paramètres
+    courants sont donc traduits en arguments asyncpg :
+    - sslmode -> ssl (mêmes valeurs : disable, require, verify-full...) ;
+    - connect_timeout -> timeout (secondes) ;
+    - application_name -> server_settings["application_name"].
+
+    Paramètres
+    ----------
+    raw_url : str
+        URL de connexion, quel que soit le driver indiqué
+        (postgresql://, postgresql+psycopg2://...).
+
+    Returns
+    -------
+    Tuple[URL, Dict[str, Any]]
+        URL sans paramètres de requête (driver asyncpg) et arguments
+        de connexion à passer via connect_args.
+
+    Raises
+    ------
+    ValueError
+        Si l'URL contient un paramètre sans équivalent asyncpg.
+    """
+    url = make_url(raw_url).set(drivername="postgresql+asyncpg")
+    query = dict(url.query)
+    connect_args: Dict[str, Any] = {}
+    if "sslmode" in query:
+        connect_args["ssl"] = query.pop("sslmode")
+    if "connect_timeout" in query:
+        connect_args["timeout"] = float(query.pop("connect_timeout"))
+    if "application_name" in query:
+        connect_args["server_settings"] = {"application_name": query.pop("application_name")}
+    if query:
+        raise ValueError(
+            "Paramètres de DATABASE_URL non supportés par asyncpg : " + ", ".join(sorted(query))
+        )
+    return url.set(query={}), connect_args
+
+
 # NOTE IMPORTANTE :
 # settings.DATABASE_URL est de type PostgresDsn (objet Pydantic).
-# On le convertit explicitement en str pour le passer à SQLAlchemy.
-engine = create_engine(
-    str(settings.DATABASE_URL),
-    pool_pre_ping=True,
-)
+# On le convertit une seule fois en str, puis on force le driver asyncpg
+# (voir _asyncpg_url).
+DATABASE_URL, _connect_args = _asyncpg_url(str(settings.DATABASE_URL))
+
+# Options du pool de connexions.
+if settings.DB_USE_PGBOUNCER:
+    # PgBouncer (pool_mode=transaction) mutualise déjà les connexions :
+    # l'application ouvre/ferme une connexion logique par requête (NullPool).
+    # Une transaction pouvant changer de backend PostgreSQL, les requêtes
+    # préparées nommées d'asyncpg doivent être désactivées ou rendues uniques.
+    _engine_options: Dict[str, Any] = {
+        "poolclass": NullPool,
+        "connect_args": {
+            **_connect_args,
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        },
+    }
+else:
+    # pool_pre_ping permet de vérifier que les connexions sont encore valides.
+    # Le pool par défaut (5 connexions) fait attendre les requêtes dès
+    # quelques appels concurrents : sa taille est réglable via les settings.
+    # pool_recycle évite de réutiliser des connexions coupées par un
+    # pare-feu ou un proxy après une longue inactivité.
+    _engine_options = {
+        "connect_args": _connect_args,
+        "pool_pre_ping": True,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
 
-# Fabrique de sessions. Chaque requête FastAPI utilisera
-# une instance de cette SessionLocal.
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Engine SQLAlchemy (asyncpg).
+engine = create_async_engine(DATABASE_URL, query_cache_size=1200, **_engine_options)
 
+# Fabrique de sessions asynchrones. Chaque requête FastAPI utilisera
+# une instance de cette AsyncSessionLocal.
+AsyncSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
-def get_db() -> Session:
+
+async def get_db() -> AsyncIterator[AsyncSession]:
     """
     Dépendance FastAPI pour obtenir une session de base de données.
 
@@ -39,11 +122,23 @@ def get_db() -> Session:
 
     Yields
     ------
-    Session
-        Instance de session SQLAlchemy liée à la requête courante.
+    AsyncSession
+        Instance de session SQLAlchemy asynchrone liée à la requête courante.
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+async def warm_up_pool() -> None:
+    """
+    Ouvre à l'avance les connexions du pool.
+
+    Appelée au démarrage (lifespan) : les poignées de main TCP/TLS et
+    l'authentification PostgreSQL ne sont plus payées par les premières
+    requêtes HTTP. Sans effet derrière PgBouncer (NullPool).
+    """
+    if settings.DB_USE_PGBOUNCER:
+        return
+    connections = await asyncio.gather(*(engine.connect() for _ in range(settings.DB_POOL_SIZE)))
+    # close() rend chaque connexion au pool, qui la garde ouverte.
+    await asyncio.gather(*(conn.close() for conn in connections))
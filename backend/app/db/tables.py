@@ -18,24 +18,119 @@ Limite :
   un contrat de données plus strict.
 """
 
-from functools import lru_cache
-from typing import Dict
+import os
+import pickle
+import sys
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
 
-from sqlalchemy import MetaData, Table
+import sqlalchemy
+from sqlalchemy import Connection, MetaData, Table, bindparam, text
 
+from app.core.config import settings
 from app.db.session import engine
 
 # MetaData global partagé pour toutes les tables.
 metadata = MetaData()
 
+# Tables exposées par l'API.
+SUPPORTED_TABLES: Tuple[str, ...] = ("sites", "trb", "pmwo", "swo")
+
+# Index {nom_table: Table} rempli par reflect_tables().
+_TABLES: Dict[str, Table] = {}
+
+# Vue en lecture seule sur _TABLES, partagée par tous les appelants.
+_SUPPORTED: Mapping[str, Table] = MappingProxyType(_TABLES)
+
+# Empreinte des colonnes des tables supportées, calculée en une requête.
+# Elle change dès qu'une colonne est ajoutée, supprimée ou modifiée (type,
+# longueur, précision et échelle comprises), ce qui invalide le cache
+# disque des métadonnées (voir _reflect_with_cache).
+_SCHEMA_FINGERPRINT = text(
+    """
+    SELECT md5(string_agg(
+        table_name || '.' || column_name || ':' || udt_name || ':'
+            || coalesce(character_maximum_length::text, '') || ':'
+            || coalesce(numeric_precision::text, '') || ':'
+            || coalesce(numeric_scale::text, '') || ':'
+            || coalesce(datetime_precision::text, '') || ':'
+            || is_nullable || ':' || coalesce(column_default, ''),
+        ',' ORDER BY table_name, ordinal_position
+    ))
+    FROM information_schema.columns
+    WHERE table_schema = current_schema() AND table_name IN :names
+    """
+).bindparams(bindparam("names", expanding=True))
+
+
+def _reflect_with_cache(conn: Connection, cache_dir: Path) -> None:
+    """
+    Réfléchit les tables supportées en passant par un cache disque.
+
+    Si un fichier correspondant à l'empreinte actuelle du schéma existe,
+    les tables sont chargées depuis ce fichier (une seule requête vers la
+    base). Sinon, la réflexion est faite normalement puis enregistrée.
+
+    Paramètres
+    ----------
+    conn : Connection
+        Connexion synchrone fournie par AsyncConnection.run_sync.
+    cache_dir : Path
+        Répertoire du cache (créé si nécessaire).
+    """
+    fingerprint = conn.execute(_SCHEMA_FINGERPRINT, {"names": list(SUPPORTED_TABLES)}).scalar_one()
+    # Un pickle n'est relu que par la même version de SQLAlchemy et de
+    # Python : après une mise à jour, un nouveau fichier est écrit.
+    versions = f"sa{sqlalchemy.__version__}_py{sys.version_info.major}.{sys.version_info.minor}"
+    path = cache_dir / f"metadata_{versions}_{fingerprint}.pickle"
+    if fingerprint is not None and path.exists():
+        # Le fichier n'est lu que dans un répertoire fixé par la configuration
+        # du déploiement : il doit rester inaccessible en écriture aux tiers.
+        with path.open("rb") as f:
+            cached: MetaData = pickle.load(f)
+        for table in cached.sorted_tables:
+            table.to_metadata(metadata)
+        return
+
+    metadata.reflect(bind=conn, only=list(SUPPORTED_TABLES))
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Écriture dans un fichier temporaire puis renommage atomique, pour
+    # qu'un autre worker ne lise jamais un fichier partiellement écrit.
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp_path.open("wb") as f:
+        pickle.dump(metadata, f)
+    tmp_path.replace(path)
+
+
+async def reflect_tables() -> None:
+    """
+    Charge en une seule passe les métadonnées des tables supportées.
+
+    Appelée au démarrage de l'application (voir app/main.py) : les
+    requêtes vers pg_catalog sont ainsi faites une fois pour toutes,
+    et non lors de la première requête HTTP visant chaque table.
+    Une table absente de la base fait échouer le démarrage.
+
+    Si METADATA_CACHE_DIR est configuré, les métadonnées sont relues
+    depuis le disque tant que le schéma n'a pas changé.
+    """
+    # La réflexion SQLAlchemy est synchrone : run_sync l'exécute sur la
+    # connexion asyncpg sans bloquer la boucle d'événements.
+    async with engine.connect() as conn:
+        if settings.METADATA_CACHE_DIR:
+            await conn.run_sync(_reflect_with_cache, Path(settings.METADATA_CACHE_DIR))
+        else:
+            await conn.run_sync(metadata.reflect, only=list(SUPPORTED_TABLES))
+    _TABLES.update((name, metadata.tables[name]) for name in SUPPORTED_TABLES)
+
 
-@lru_cache(maxsize=32)
 def get_table(table_name: str) -> Table:
     """
     Retourne un objet Table SQLAlchemy correspondant au nom fourni.
 
-    La fonction utilise un cache (lru_cache) pour éviter de recharger
-    les métadonnées à chaque appel, ce qui améliore les performances.
+    Les tables sont réfléchies au démarrage par reflect_tables() ;
+    cette fonction se contente d'une lecture dans un dictionnaire.
 
     Paramètres
     ----------
@@ -46,13 +141,20 @@ def get_table(table_name: str) -> Table:
     -------
     Table
         Objet Table SQLAlchemy représentant la table.
+
+    Raises
+    ------
+    KeyError
+        Si la table n'a pas été réfléchie (table non supportée,
+        ou reflect_tables() pas encore appelée).
     """
-    # autoload_with=engine déclenche la réflexion des métadonnées.
-    table = Table(table_name, metadata, autoload_with=engine)
-    return table
+    try:
+        return _TABLES[table_name]
+    except KeyError:
+        raise KeyError(f"Table '{table_name}' non réfléchie (tables supportées : {SUPPORTED_TABLES})") from None
 
 
-def list_supported_tables() -> Dict[str, Table]:
+def list_supported_tables() -> Mapping[str, Table]:
     """
     Retourne un dictionnaire des tables supportées par l'API.
 
@@ -62,10 +164,12 @@ def list_supported_tables() -> Dict[str, Table]:
     - pmwo
     - swo
 
+    Le mapping est une vue en lecture seule construite une fois à l'import :
+    aucun dictionnaire n'est recréé à chaque appel.
+
     Returns
     -------
-    Dict[str, Table]
-        Dictionnaire {nom_table: Table}.
+    Mapping[str, Table]
+        Mapping {nom_table: Table}, non modifiable.
     """
-    table_names = ["sites", "trb", "pmwo", "swo"]
-    return {name: get_table(name) for name in table_names}
+    return _SUPPORTED
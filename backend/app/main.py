@@ -7,19 +7,49 @@ Ce module :
 - instancie l'application FastAPI ;
 - configure les métadonnées (titre, version) ;
 - enregistre les routes de l'API v1 (sites, trb, pmwo, swo) ;
+- charge les métadonnées des tables et prépare le pool au démarrage (lifespan) ;
 - expose un endpoint racine simple pour vérifier que le service est en ligne.
 """
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.core.config import settings
-from app.api.v1 import routes_sites, routes_trb, routes_pmwo, routes_swo
+from app.core.middleware import HealthCheckMiddleware
+from app.api.responses import ORJSONResponse
+from app.api.v1.api import api_router
+from app.db.session import engine, warm_up_pool
+from app.db.tables import reflect_tables
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Cycle de vie de l'application.
+
+    Au démarrage, réfléchit les tables supportées et ouvre les connexions
+    du pool avant la première requête. À l'arrêt, ferme proprement
+    toutes les connexions.
+    """
+    await reflect_tables()
+    await warm_up_pool()
+    yield
+    await engine.dispose()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version="0.1.0",
     description="API de gestion des infrastructures passives (Pegasus).",
+    lifespan=lifespan,
+    # Classe utilisée pour les routes qui renvoient des données brutes
+    # (aucune à ce jour : listes, racine et erreurs construisent leur
+    # propre réponse) ; les futurs endpoints seront encodés via orjson.
+    default_response_class=ORJSONResponse,
 )
 
 # Configuration CORS : autoriser le frontend Vite sur http://localhost:5173
@@ -32,25 +62,47 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,         # Origines autorisées
     allow_credentials=True,
-    allow_methods=["*"],           # Méthodes HTTP autorisées
-    allow_headers=["*"],           # En-têtes HTTP autorisés
+    # Listes explicites plutôt que "*" : Starlette précalcule alors les
+    # en-têtes de preflight au lieu de recopier ceux de chaque requête.
+    # L'API v1 est en lecture seule : seul GET est exposé.
+    allow_methods=["GET"],         # Méthodes HTTP autorisées
+    allow_headers=["Authorization", "Content-Type", "X-Requested-With"],  # En-têtes autorisés
+    # Durée (s) de mise en cache des preflights OPTIONS par le navigateur.
+    # Starlette envoie 600 par défaut ; les navigateurs plafonnent
+    # eux-mêmes la valeur (2 h pour Chrome, 24 h pour Firefox).
+    max_age=86400,
 )
 
+# Compression gzip des réponses (listes JSON de plusieurs centaines de Ko),
+# uniquement si le client l'accepte et au-delà de 1 Ko. Ajoutée après CORS
+# pour l'envelopper : les en-têtes CORS sont posés avant la compression.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Sonde de santé : GET / est servi directement par HealthCheckMiddleware,
+# sans routage ni dépendances. Il est ajouté en dernier pour être le plus
+# externe (le dernier middleware ajouté s'exécute en premier).
+ROOT_BODY = b'{"status":"ok","message":"Pegasus Passive Infra API running"}'
+app.add_middleware(HealthCheckMiddleware, body=ROOT_BODY, path="/")
+
+
 @app.get("/", tags=["health"])
-def read_root() -> dict:
+def read_root() -> Response:
     """
     Endpoint racine permettant de vérifier que l'API répond.
 
+    En pratique, GET / est intercepté par HealthCheckMiddleware ;
+    la route reste déclarée pour apparaître dans la documentation.
+
     Returns
     -------
-    dict
-        Message simple indiquant que le service est opérationnel.
+    Response
+        Message simple indiquant que le service est opérationnel,
+        pré-encodé en JSON (ROOT_BODY).
     """
-    return {"status": "ok", "message": "Pegasus Passive Infra API running"}
+    # Le corps est encodé une seule fois ; l'objet Response est recréé à
+    # chaque appel car les middlewares (CORS) modifient ses en-têtes.
+    return Response(ROOT_BODY, media_type="application/json")
 
 
-# Inclusion des routes v1
-app.include_router(routes_sites.router, prefix="/api/v1")
-app.include_router(routes_trb.router, prefix="/api/v1")
-app.include_router(routes_pmwo.router, prefix="/api/v1")
-app.include_router(routes_swo.router, prefix="/api/v1")
+# Inclusion des routes v1 (sites, trb, pmwo, swo) via le router principal
+app.include_router(api_router)
@@ -0,0 +1,43 @@
+"""
+Fichier : backend/tests/conftest.py
+
+Configuration commune des tests.
+
+Les modules de l'application lisent DATABASE_URL dès leur import. Les
+tests unitaires n'ouvrent aucune connexion : si aucune URL n'est
+configurée (variable d'environnement ou fichier .env), une URL locale
+est utilisée par défaut.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+if "DATABASE_URL" not in os.environ and not Path(".env").exists():
+    os.environ["DATABASE_URL"] = "postgresql://postgres@localhost:5432/pegasus"
+
+
+class FakeResult:
+    """
+    Substitut minimal d'AsyncResult : noms de colonnes et partitions.
+    """
+
+    def __init__(self, keys, partitions):
+        self._keys = keys
+        self._partitions = partitions
+
+    def keys(self):
+        return self._keys
+
+    async def partitions(self):
+        for partition in self._partitions:
+            yield partition
+
+
+@pytest.fixture
+def fake_result():
+    """
+    Fabrique de résultats SQL factices pour les tests sans base.
+    """
+    return FakeResult
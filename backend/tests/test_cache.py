@@ -0,0 +1,69 @@
+"""
+Fichier : backend/tests/test_cache.py
+
+Tests du cache mémoire des réponses de liste (app/api/cache.py).
+"""
+
+import asyncio
+
+from app.api.cache import ResponseCache
+
+KEY = ("trb", ("id",), 10, 0)
+PARTITIONS = [[(1,), (2,)], [(3,)]]
+BODY = b'[{"id":1},{"id":2},{"id":3}]'
+
+
+def consume(response, chunks=None):
+    """
+    Lit le corps d'une réponse diffusée, entièrement ou sur `chunks` morceaux.
+    """
+
+    async def run():
+        body = []
+        iterator = response.body_iterator
+        async for chunk in iterator:
+            body.append(chunk)
+            if chunks is not None and len(body) == chunks:
+                await iterator.aclose()
+                break
+        return b"".join(body)
+
+    return asyncio.run(run())
+
+
+def test_miss_then_hit(fake_result):
+    cache = ResponseCache(ttl=60, max_bytes=1024)
+    assert cache.get(KEY) is None
+
+    response = cache.stream(KEY, fake_result(("id",), PARTITIONS))
+    assert response.headers["X-Cache"] == "MISS"
+    assert consume(response) == BODY
+
+    cached = cache.get(KEY)
+    assert cached is not None
+    assert cached.headers["X-Cache"] == "HIT"
+    assert cached.media_type == "application/json"
+    assert cached.body == BODY
+
+
+def test_body_over_budget_is_not_stored(fake_result):
+    cache = ResponseCache(ttl=60, max_bytes=len(BODY) - 1)
+
+    assert consume(cache.stream(KEY, fake_result(("id",), PARTITIONS))) == BODY
+    assert cache.get(KEY) is None
+
+
+def test_interrupted_stream_is_not_stored(fake_result):
+    cache = ResponseCache(ttl=60, max_bytes=1024)
+
+    consume(cache.stream(KEY, fake_result(("id",), PARTITIONS)), chunks=1)
+    assert cache.get(KEY) is None
+
+
+def test_disabled_cache_never_stores(fake_result):
+    cache = ResponseCache(ttl=0, max_bytes=1024)
+
+    response = cache.stream(KEY, fake_result(("id",), PARTITIONS))
+    assert response.headers["X-Cache"] == "MISS"
+    assert consume(response) == BODY
+    assert cache.get(KEY) is None
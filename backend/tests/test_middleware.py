@@ -0,0 +1,70 @@
+"""
+Fichier : backend/tests/test_middleware.py
+
+Tests du middleware de sonde de santé (app/core/middleware.py).
+"""
+
+import asyncio
+
+from app.core.middleware import HealthCheckMiddleware
+
+BODY = b'{"status":"ok"}'
+
+
+async def downstream(scope, receive, send):
+    """
+    Application enveloppée : répond 404 pour signaler qu'elle a été appelée.
+    """
+    await send({"type": "http.response.start", "status": 404, "headers": []})
+    await send({"type": "http.response.body", "body": b"app"})
+
+
+def call(scope):
+    """
+    Exécute le middleware sur une requête et retourne les messages envoyés.
+    """
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    middleware = HealthCheckMiddleware(downstream, body=BODY, path="/")
+    asyncio.run(middleware(scope, receive, send))
+    return messages
+
+
+def http_scope(method="GET", path="/"):
+    return {"type": "http", "method": method, "path": path, "headers": []}
+
+
+def test_health_probe_is_answered_directly():
+    start, body = call(http_scope())
+
+    assert start["status"] == 200
+    assert dict(start["headers"]) == {
+        b"content-type": b"application/json",
+        b"content-length": str(len(BODY)).encode(),
+    }
+    assert body["body"] == BODY
+
+
+def test_other_paths_reach_the_application():
+    start, body = call(http_scope(path="/api/v1/sites/"))
+
+    assert start["status"] == 404
+    assert body["body"] == b"app"
+
+
+def test_other_methods_reach_the_application():
+    start, _ = call(http_scope(method="HEAD"))
+
+    assert start["status"] == 404
+
+
+def test_non_http_scopes_reach_the_application():
+    start, _ = call({"type": "websocket", "path": "/"})
+
+    assert start["status"] == 404
@@ -0,0 +1,50 @@
+"""
+Fichier : backend/tests/test_responses.py
+
+Tests de l'encodage JSON des lignes (app/api/responses.py).
+"""
+
+import asyncio
+from datetime import datetime, time, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy.sql.elements import quoted_name
+
+from app.api.responses import _dumps, _iter_json_rows
+
+
+def collect(result):
+    async def run():
+        return b"".join([chunk async for chunk in _iter_json_rows(result)])
+
+    return asyncio.run(run())
+
+
+def test_dumps_keeps_pydantic_formats():
+    content = {
+        "montant": Decimal("12.50"),
+        "duree": timedelta(days=1, hours=2),
+        "created_at": datetime(2024, 1, 1, 10, tzinfo=timezone.utc),
+    }
+
+    assert _dumps(content) == b'{"montant":"12.50","duree":"P1DT2H","created_at":"2024-01-01T10:00:00Z"}'
+
+
+def test_dumps_encodes_timezone_aware_time():
+    # Colonne "time with time zone" : orjson seul lève TypeError.
+    content = [{"heure": time(10, tzinfo=timezone(timedelta(hours=2))), "jour": datetime(2024, 1, 1, 10)}]
+
+    assert _dumps(content) == b'[{"heure":"10:00:00+02:00","jour":"2024-01-01T10:00:00"}]'
+
+
+def test_iter_json_rows_accepts_reflected_column_names(fake_result):
+    result = fake_result(
+        (quoted_name("id", None), quoted_name("heure", None)),
+        [[(1, time(10, tzinfo=timezone.utc))], [(2, None)]],
+    )
+
+    assert collect(result) == b'[{"id":1,"heure":"10:00:00Z"},{"id":2,"heure":null}]'
+
+
+def test_iter_json_rows_without_rows(fake_result):
+    assert collect(fake_result(("id",), [])) == b"[]"
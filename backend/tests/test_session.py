@@ -0,0 +1,35 @@
+"""
+Fichier : backend/tests/test_session.py
+
+Tests de l'adaptation de DATABASE_URL au driver asyncpg (app/db/session.py).
+"""
+
+import pytest
+
+from app.db.session import _asyncpg_url
+
+
+def test_driver_is_forced_to_asyncpg():
+    url, connect_args = _asyncpg_url("postgresql+psycopg2://user:secret@db:5432/pegasus")
+
+    assert url.drivername == "postgresql+asyncpg"
+    assert (url.username, url.password, url.host, url.port, url.database) == ("user", "secret", "db", 5432, "pegasus")
+    assert connect_args == {}
+
+
+def test_libpq_parameters_are_translated():
+    url, connect_args = _asyncpg_url(
+        "postgresql://user@db/pegasus?sslmode=require&connect_timeout=5&application_name=pegasus-api"
+    )
+
+    assert dict(url.query) == {}
+    assert connect_args == {
+        "ssl": "require",
+        "timeout": 5.0,
+        "server_settings": {"application_name": "pegasus-api"},
+    }
+
+
+def test_unsupported_parameters_are_rejected():
+    with pytest.raises(ValueError, match="options, target_session_attrs"):
+        _asyncpg_url("postgresql://user@db/pegasus?sslmode=require&target_session_attrs=any&options=-c%20x")